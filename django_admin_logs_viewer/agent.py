@@ -0,0 +1,88 @@
+import os
+import hmac
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from .storage import LocalStorage, RemoteStorage
+
+logger = logging.getLogger(__name__)
+
+class LogsAgentHandler(BaseHTTPRequestHandler):
+    """
+    Serves log files of this machine to RemoteStorage (see `logs_agent` command).
+    Only paths inside `server.roots` (after resolving symlinks) are accessible.
+    """
+    protocol_version = "HTTP/1.1" # Keep-alive, so RemoteStorage can reuse connections
+    storage = LocalStorage()
+    max_read_bytes = RemoteStorage.READ_BUFFER_SIZE # RemoteStorage never asks for more in one request
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        action = url.path.rstrip("/").rsplit("/", 1)[-1]
+
+        # Bytes, compare_digest() raises TypeError for non-ASCII strings (headers are decoded as latin-1)
+        authorization = self.headers.get("Authorization", "").encode("latin-1")
+        if not hmac.compare_digest(authorization, f"Bearer {self.server.token}".encode()):
+            return self._send(403, b"Forbidden")
+
+        path = os.path.abspath(params.get("path", ""))
+        real_path = os.path.realpath(path) # Symlinks must not lead outside of the roots
+        if not any(self.storage.is_inside(real_path, root) for root in self.server.roots):
+            return self._send(404, b"Not found")
+
+        try:
+            if action == "stat":
+                return self._send_json(self._stat(path))
+            if action == "list":
+                dirs, files = self.storage.listdir(path)
+                return self._send_json({"dirs": dirs, "files": files})
+            if action == "walk":
+                return self._send_json({"entries": list(self.storage.walk(path))})
+            if action == "stat_tree":
+                return self._send_json({"stats": self.storage.stat_tree(path)})
+            if action == "read":
+                start, end = int(params["start"]), int(params["end"])
+                if start < 0 or end < start or end - start > self.max_read_bytes:
+                    return self._send(400, f"Invalid range, at most {self.max_read_bytes} bytes can be read at once.".encode())
+                return self._send(200, self.storage.read_range(path, start, end), "application/octet-stream")
+        except FileNotFoundError:
+            return self._send(404, b"Not found")
+        except (OSError, KeyError, ValueError) as e:
+            return self._send(400, str(e).encode())
+        return self._send(404, b"Unknown action")
+
+    def _stat(self, path):
+        exists = self.storage.exists(path)
+        ino, size, mtime_ns = self.storage.stat(path) if exists else (0, 0, 0)
+        return {
+            "exists": exists,
+            "is_dir": self.storage.isdir(path),
+            "is_file": self.storage.isfile(path),
+            "ino": ino,
+            "size": size,
+            "mtime_ns": mtime_ns,
+        }
+
+    def _send_json(self, data):
+        self._send(200, json.dumps(data).encode(), "application/json")
+
+    def _send(self, status, body, content_type="text/plain"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+def make_agent_server(roots, token, host="127.0.0.1", port=8765):
+    if not token:
+        raise ValueError("Logs agent requires a token (LOGS_AGENT_TOKEN).")
+    server = ThreadingHTTPServer((host, port), LogsAgentHandler)
+    server.daemon_threads = True
+    server.roots = [os.path.realpath(root) for root in roots]
+    server.token = token
+    return server
@@ -1,5 +1,14 @@
 DEFAULTS = {
     "LOGS_ROWS_PER_PAGE": 100,
     "LOGS_SHOW_ERRORS_SINCE_LAST_LOG_IN": False,
+    "LOGS_MAX_LINE_LENGTH": 10_000,
+    "LOGS_MAX_TRACEBACK_LINES": 1_000,
+    "LOGS_MAX_FETCH_BYTES": 5 * 1024 * 1024,
+    "LOGS_RAW_CONTENT_PAGE_BYTES": 256 * 1024,
+    "LOGS_ROTATED_FILE_PATTERN": r"\.\d{4}-\d{2}-\d{2}(_\d{2}(-\d{2}){0,2})?(\.gz|\.bz2|\.zip)?$", # E.g. app.log.2025-08-22, not app.log.1 (renamed on every rollover)
+    "LOGS_ROTATED_FILE_MIN_AGE": 24 * 60 * 60, # Seconds since the last modification, today's file may still be written to
+    "LOGS_ROTATED_CACHE_MAX_AGE": 30 * 24 * 60 * 60,
+    "LOGS_MAX_WORKERS": 8,
+    "LOGS_AGENT_TOKEN": None,
     "datetime_format": "%Y-%m-%d %H:%M:%S,%f",
 }
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django_admin_logs_viewer.agent import make_agent_server
+from django_admin_logs_viewer.conf import app_settings
+
+class Command(BaseCommand):
+    help = "Serve local LOGS_DIRS to admin panels running on other machines (RemoteStorage)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--token", default=None, help="Defaults to LOGS_AGENT_TOKEN setting.")
+
+    def handle(self, *args, **options):
+        roots = [d["path"] for d in app_settings.LOGS_DIRS or [] if not d.get("storage")]
+        try:
+            server = make_agent_server(roots, options["token"] or app_settings.LOGS_AGENT_TOKEN, options["host"], options["port"])
+        except ValueError as e:
+            raise CommandError(e)
+
+        self.stdout.write(f"Serving logs from {', '.join(roots)} on {options['host']}:{options['port']}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
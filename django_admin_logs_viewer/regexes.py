@@ -0,0 +1,14 @@
+# No Django imports here, this module is imported from settings.py
+
+class LOGS_PREDEFINED_REGEXES:
+    # JSON style log: {"level":"INFO","time":"2025-08-22T12:34:56","path":"/app","file":"app.py","message":"Something happened"}
+    json = r'^\{\s*"level"\s*:\s*"([^"]+)"\s*,\s*"datetime"\s*:\s*"([^"]+)"\s*,\s*"source"\s*:\s*"([^"]+)"\s*,\s*"file"\s*:\s*"([^"]+)"\s*,\s*"message"\s*:\s*"([^"]+)"\s*\}$'
+
+    # Comma-separated: Level,Time,Path,File,Message
+    comma_separated = r'^(.*?),(.*?),(.*?),(.*?),(.*)$'
+
+    # Space-separated simple log: [LEVEL] 2025-08-22T12:34:56 Message
+    simple_space = r'^\[(\w+)\]\s+(\S+)\s+(.*)$'
+
+    # Syslog format: Aug 22 12:34:56 hostname program[pid]: message
+    syslog = r'^(\w+\s+\d+\s+\d+:\d+:\d+)\s+(\S+)\s+(\S+)\[(\d+)\]:\s+(.*)$'
@@ -0,0 +1,324 @@
+import io
+import os
+import json
+import posixpath
+import threading
+from queue import LifoQueue, Empty, Full
+from urllib.parse import urlsplit, urlencode
+
+class BaseLogStorage:
+    """
+    Where log files of a LOGS_DIRS entry live.
+    Paths are plain strings; `self.path` is the module used to manipulate them (os.path or posixpath).
+    """
+    path = posixpath
+    host = None # Shown next to the entry name when logs come from another machine
+
+    def __repr__(self): # Stable between processes, it is a part of ETags
+        return f"{type(self).__name__}({self.host or ''})"
+
+    def normpath(self, path):
+        return self.path.normpath(path)
+
+    def is_inside(self, path, root):
+        try:
+            return self.path.commonpath([path, root]) == root
+        except ValueError: # E.g. mixing absolute and relative paths
+            return False
+
+    def exists(self, path):
+        raise NotImplementedError
+
+    def isdir(self, path):
+        raise NotImplementedError
+
+    def isfile(self, path):
+        raise NotImplementedError
+
+    def listdir(self, path):
+        """Return sorted (dirs, files) names."""
+        raise NotImplementedError
+
+    def stat(self, path):
+        """Return (inode, size, mtime in nanoseconds)."""
+        raise NotImplementedError
+
+    def open(self, path):
+        """Open a file for reading in binary mode. The file supports readline(), seek() and tell()."""
+        raise NotImplementedError
+
+    def walk(self, path):
+        dirs, files = self.listdir(path)
+        yield path, dirs, files
+        for name in dirs:
+            yield from self.walk(self.path.join(path, name))
+
+    def stat_tree(self, path):
+        """[(path, inode, size, mtime_ns)] of a file, or of a directory and everything inside it."""
+        paths = [path]
+        if self.isdir(path):
+            for root, dirs, files in self.walk(path):
+                paths.extend(self.path.join(root, name) for name in dirs + files)
+
+        stats = []
+        for item_path in paths:
+            try:
+                stats.append((item_path, *self.stat(item_path)))
+            except OSError: # Removed in the meantime (e.g. during rotation)
+                continue
+        return stats
+
+    def read_range(self, path, start, end):
+        with self.open(path) as f:
+            f.seek(start)
+            return f.read(end - start)
+
+class LocalStorage(BaseLogStorage):
+    """Files on the local filesystem (default)."""
+    path = os.path
+
+    def normpath(self, path):
+        return os.path.abspath(path)
+
+    def exists(self, path):
+        return os.path.exists(path)
+
+    def isdir(self, path):
+        return os.path.isdir(path)
+
+    def isfile(self, path):
+        return os.path.isfile(path)
+
+    def listdir(self, path):
+        dirs, files = [], []
+        for name in sorted(os.listdir(path)):
+            (dirs if os.path.isdir(os.path.join(path, name)) else files).append(name)
+        return dirs, files
+
+    def walk(self, path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            yield root, dirs, sorted(files)
+
+    def stat(self, path):
+        st = os.stat(path)
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def open(self, path):
+        return open(path, "rb")
+
+class DjangoStorage(BaseLogStorage):
+    """
+    Files in a Django storage, given as an instance or an alias from settings.STORAGES.
+    LOGS_DIRS paths are names inside the storage ("" is its root).
+    """
+    def __init__(self, storage="default"):
+        self._storage = storage
+
+    @property
+    def storage(self):
+        if isinstance(self._storage, str):
+            from django.core.files.storage import storages
+            self._storage = storages[self._storage]
+        return self._storage
+
+    @property
+    def host(self):
+        return self._storage if isinstance(self._storage, str) else type(self._storage).__name__
+
+    def normpath(self, path):
+        path = posixpath.normpath(path).lstrip("/")
+        return "" if path == "." else path
+
+    def is_inside(self, path, root):
+        if path == ".." or path.startswith("../"):
+            return False
+        return not root or super().is_inside(path, root)
+
+    def _parent_listing(self, path):
+        parent, name = posixpath.split(path)
+        try:
+            return name, self.listdir(parent)
+        except (OSError, NotImplementedError):
+            return name, ([], [])
+
+    def exists(self, path):
+        return self.isdir(path) or self.isfile(path)
+
+    def isdir(self, path):
+        if not path:
+            return True
+        name, (dirs, files) = self._parent_listing(path)
+        return name in dirs
+
+    def isfile(self, path):
+        name, (dirs, files) = self._parent_listing(path)
+        return bool(path) and name in files
+
+    def listdir(self, path):
+        dirs, files = self.storage.listdir(path)
+        return sorted(dirs), sorted(files)
+
+    def stat(self, path):
+        try:
+            mtime_ns = int(self.storage.get_modified_time(path).timestamp() * 1_000_000_000)
+        except NotImplementedError:
+            mtime_ns = 0
+        return 0, self.storage.size(path), mtime_ns
+
+    def open(self, path):
+        return self.storage.open(path, "rb")
+
+class _ConnectionPool:
+    """Keep-alive HTTP connections to a single host, shared between threads and requests."""
+    def __init__(self, scheme, netloc, timeout, size):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self._idle = LifoQueue(maxsize=size)
+
+    def get(self):
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            import http.client
+            connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return connection_class(self.netloc, timeout=self.timeout)
+
+    def put(self, connection):
+        try:
+            self._idle.put_nowait(connection)
+        except Full:
+            connection.close()
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def _get_pool(scheme, netloc, timeout, size):
+    with _pools_lock:
+        key = (scheme, netloc)
+        if key not in _pools:
+            _pools[key] = _ConnectionPool(scheme, netloc, timeout, size)
+        return _pools[key]
+
+class _RemoteFile(io.RawIOBase):
+    def __init__(self, storage, path):
+        self._storage = storage
+        self._path = path
+        self._position = 0
+        self._size = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            if self._size is None:
+                self._size = self._storage.stat(self._path)[1]
+            offset += self._size
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer):
+        if self._size is not None and self._position >= self._size: # Don't ask the agent again at the end of file
+            return 0
+        data = self._storage.read_range(self._path, self._position, self._position + len(buffer))
+        buffer[:len(data)] = data
+        self._position += len(data)
+        if len(data) < len(buffer):
+            self._size = self._position
+        return len(data)
+
+class RemoteStorage(BaseLogStorage):
+    """
+    Files on another machine, served by `python manage.py logs_agent` running there.
+    Only ranged reads are sent over the network; connections are pooled per host.
+    """
+    READ_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, url, token=None, timeout=10, pool_size=8):
+        parts = urlsplit(url)
+        self.host = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+        self._token = token
+        self._pool = _get_pool(parts.scheme, parts.netloc, timeout, pool_size)
+
+    def _request(self, action, **params):
+        import http.client # Not needed by settings.py importing this module
+        headers = {"Authorization": f"Bearer {self._token or _default_agent_token()}"}
+        url = f"{self._prefix}/{action}?{urlencode(params)}"
+
+        for attempt in range(2): # Pooled connection may have been closed by the agent, retry once with a new one
+            connection = self._pool.get()
+            try:
+                connection.request("GET", url, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                if attempt:
+                    raise ConnectionError(f"Logs agent {self.host} is unavailable: {e}") from e
+                continue
+            self._pool.put(connection)
+            break
+
+        if response.status == 404:
+            raise FileNotFoundError(f"{self.host}:{params.get('path')}")
+        if response.status != 200:
+            raise OSError(f"Logs agent {self.host} returned {response.status}: {body[:200].decode(errors='ignore')}")
+        return body
+
+    def _request_json(self, action, **params):
+        return json.loads(self._request(action, **params))
+
+    def exists(self, path):
+        return self._request_json("stat", path=path)["exists"]
+
+    def isdir(self, path):
+        return self._request_json("stat", path=path)["is_dir"]
+
+    def isfile(self, path):
+        return self._request_json("stat", path=path)["is_file"]
+
+    def listdir(self, path):
+        data = self._request_json("list", path=path)
+        return data["dirs"], data["files"]
+
+    def walk(self, path):
+        for root, dirs, files in self._request_json("walk", path=path)["entries"]:
+            yield root, dirs, files
+
+    def stat(self, path):
+        data = self._request_json("stat", path=path)
+        if not data["exists"]:
+            raise FileNotFoundError(f"{self.host}:{path}")
+        return data["ino"], data["size"], data["mtime_ns"]
+
+    def stat_tree(self, path):
+        return [tuple(entry) for entry in self._request_json("stat_tree", path=path)["stats"]]
+
+    def read_range(self, path, start, end):
+        chunks = []
+        while start < end: # The agent serves at most READ_BUFFER_SIZE bytes per request
+            chunk_end = min(end, start + self.READ_BUFFER_SIZE)
+            chunk = self._request("read", path=path, start=start, end=chunk_end)
+            chunks.append(chunk)
+            start += len(chunk)
+            if start < chunk_end: # End of file
+                break
+        return b"".join(chunks)
+
+    def open(self, path):
+        return io.BufferedReader(_RemoteFile(self, path), buffer_size=self.READ_BUFFER_SIZE)
+
+def _default_agent_token():
+    from django_admin_logs_viewer.conf import app_settings
+    return app_settings.LOGS_AGENT_TOKEN or ""
@@ -1,5 +1,9 @@
 from django.urls import path
-from .views.logs_view import logs_view
+
+def logs_view(request, *args, **kwargs):
+    # Views (parsers, storages, ...) are imported on the first request, not when URLconf is loaded (e.g. by management commands)
+    from .views.logs_view import logs_view
+    return logs_view(request, *args, **kwargs)
 
 urlpatterns = [
     path('', logs_view, name='logs_view'),
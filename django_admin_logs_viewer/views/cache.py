@@ -0,0 +1,117 @@
+import re
+import time
+import hashlib
+from functools import cache, wraps
+from importlib.metadata import version, PackageNotFoundError
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django_admin_logs_viewer.conf import app_settings
+from .utils import _find_log_dir, _get_storage, _map_concurrently, _validate_settings
+
+# Settings changing the rendered pages, besides LOGS_DIRS and LOGS_PARSERS
+_PAGE_SETTINGS = [
+    "LOGS_TIMEZONE",
+    "LOGS_ROWS_PER_PAGE",
+    "LOGS_SHOW_ERRORS_SINCE_LAST_LOG_IN",
+    "LOGS_MAX_LINE_LENGTH",
+    "LOGS_MAX_TRACEBACK_LINES",
+    "LOGS_MAX_FETCH_BYTES",
+    "LOGS_RAW_CONTENT_PAGE_BYTES",
+]
+
+@cache
+def _package_version(): # Templates change with upgrades
+    try:
+        return version("django-admin-logs-viewer")
+    except PackageNotFoundError:
+        return None
+
+def _is_rotated_file(storage, path, mtime_ns):
+    """Rotated files are not written to anymore. Only dated names qualify, numbered ones (app.log.1) are reused."""
+    pattern = app_settings.LOGS_ROTATED_FILE_PATTERN
+    if not pattern or re.search(pattern, storage.path.basename(path)) is None:
+        return False
+    if time.time() - mtime_ns / 1_000_000_000 < (app_settings.LOGS_ROTATED_FILE_MIN_AGE or 0): # Recently written to
+        return False
+    return storage.isfile(path)
+
+def _get_validators(request):
+    """
+    Return (etag, last_modified, is_immutable) for the requested page, download or fetch,
+    or None if the response should not be cached.
+    """
+    current_path = request.GET.get("path", "")
+    source = None
+    if current_path or request.GET.get("source"):
+        source = _find_log_dir(current_path, request.GET.get("source"))
+        if source is None:
+            return None
+        storage = _get_storage(source)
+        current_path = storage.normpath(current_path)
+        stats = storage.stat_tree(current_path)
+    else:
+        if not isinstance(app_settings.LOGS_DIRS, list):
+            return None
+
+        def stat_log_dir(index):
+            storage = _get_storage(index)
+            try:
+                return storage.stat_tree(storage.normpath(app_settings.LOGS_DIRS[index]["path"]))
+            except OSError as e: # Unavailable host is part of the page too
+                return [(index, str(e), 0, 0)]
+
+        stats = []
+        for log_dir_stats in _map_concurrently(stat_log_dir, list(range(len(app_settings.LOGS_DIRS)))):
+            stats.extend(log_dir_stats)
+
+    if not stats:
+        return None
+
+    parts = [
+        stats,
+        source,
+        sorted(request.GET.lists()),
+        # Pages depend on who is viewing them and on settings (parsers, errors since last login)
+        getattr(request.user, "pk", None),
+        request.session.get("previous_login"),
+        repr(app_settings.LOGS_DIRS),
+        repr(app_settings.LOGS_PARSERS),
+        [repr(getattr(app_settings, name)) for name in _PAGE_SETTINGS],
+        _package_version(),
+    ]
+    etag = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    last_modified_ns = max(st[3] for st in stats)
+
+    is_immutable = source is not None and _is_rotated_file(storage, current_path, last_modified_ns)
+    return quote_etag(etag), last_modified_ns // 1_000_000_000, is_immutable
+
+def _conditional_cache(view):
+    """Answer with 304 Not Modified when the requested files did not change since the last visit."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD") or _validate_settings(): # Invalid settings -> let the view show errors
+            return view(request, *args, **kwargs)
+
+        try:
+            validators = _get_validators(request)
+        except OSError: # E.g. unavailable host, let the view report it
+            validators = None
+        if validators is None:
+            return view(request, *args, **kwargs)
+        etag, last_modified, is_immutable = validators
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+
+        response.headers.setdefault("ETag", etag)
+        response.headers.setdefault("Last-Modified", http_date(last_modified))
+        if is_immutable: # Rotated files never change
+            patch_cache_control(response, private=True, max_age=app_settings.LOGS_ROTATED_CACHE_MAX_AGE)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Cookie"])
+        return response
+    return wrapper
@@ -1,18 +1,35 @@
-import os
+import zipfile
 import tempfile
-import shutil
 import logging
-from datetime import datetime
+from functools import wraps
+from urllib.parse import urlencode
 from django.shortcuts import render, redirect
-from django.http import FileResponse
+from django.http import FileResponse, JsonResponse
 from django.core.paginator import Paginator
 from django.contrib.admin.views.decorators import staff_member_required
 from django_admin_logs_viewer.conf import app_settings
-from .utils import _count_errors_in_dir, _build_breadcrumbs, _auto_drill_down, _is_inside_logs_dirs, _validate_settings
-from .parser import _parse_logs
-from django_admin_logs_viewer.defaults import DEFAULTS
+from .utils import _list_items, _filter_items_by_query, _build_breadcrumbs, _auto_drill_down, _validate_settings, _find_log_dir, _get_storage, _get_parser_name, _read_range, _read_window, _zip_dir
+from .parser import _parse_log_file, ParseMode
+from .query import _compile_query, SEARCH_HELP
+from .cache import _conditional_cache
+
+def _render_storage_errors(view):
+    """Show an error page instead of a crash when a remote storage is unavailable."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view(request, *args, **kwargs)
+        except ConnectionError as e:
+            logging.error(e)
+            return render(request, "admin/errors.html", {
+                "errors": [str(e)],
+                "breadcrumbs": [{"name": "Logs error", "url": ""}],
+            })
+    return wrapper
 
 @staff_member_required
+@_conditional_cache
+@_render_storage_errors
 def logs_view(request):
 
     # Show errors if any
@@ -27,168 +44,167 @@ def logs_view(request):
 
     log_dirs = app_settings.LOGS_DIRS
     current_path = request.GET.get("path", "")
-
-    # Check if path exists and is allowed
-    if current_path:
-        current_path = os.path.abspath(current_path)
-        if not _is_inside_logs_dirs(current_path):
+    search_query = request.GET.get("search_query", "").strip()
+    source = None
+    storage = None
+
+    # Check if path exists and is allowed ("" is a valid path inside a storage, e.g. its root)
+    if current_path or request.GET.get("source"):
+        source = _find_log_dir(current_path, request.GET.get("source"))
+        if source is None:
             return render(request, "admin/errors.html", {
                 "errors": ["Path does not exist or is outside of LOGS_DIRS."],
                 "breadcrumbs": [{"name": "Logs error", "url": ""}],
             })
+        storage = _get_storage(source)
+        current_path = storage.normpath(current_path)
 
     # Handle downloads
     if request.GET.get("download"):
-        if not current_path: # Starting directory (one with listed log_dirs)
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
-            with tempfile.TemporaryDirectory() as tmpdir:
+        if source is None: # Starting directory (one with listed log_dirs)
+            tmp = tempfile.TemporaryFile(suffix=".zip") # Removed when the response is closed
+            with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zip_file:
                 for i, log_dir in enumerate(log_dirs):
-                    path = log_dir["path"]
-                    if os.path.exists(path):
-                        dst = os.path.join(tmpdir, f"{os.path.basename(path)}_{i}")
-                        shutil.copytree(path, dst)
-                shutil.make_archive(tmp.name, "zip", tmpdir)
-            return FileResponse(open(tmp.name + ".zip", "rb"), as_attachment=True, filename="all_logs.zip")
-        elif os.path.isdir(current_path):
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
-            shutil.make_archive(tmp.name, "zip", current_path)
-            return FileResponse(open(tmp.name + ".zip", "rb"), as_attachment=True, filename=os.path.basename(current_path) + ".zip")
-        elif os.path.isfile(current_path):
-            return FileResponse(open(current_path, "rb"), as_attachment=True, filename=os.path.basename(current_path))
+                    dir_storage = _get_storage(i)
+                    path = dir_storage.normpath(log_dir["path"])
+                    try:
+                        if dir_storage.exists(path):
+                            _zip_dir(zip_file, dir_storage, path, f"{dir_storage.path.basename(path)}_{i}")
+                    except ConnectionError as e: # Skip unavailable hosts
+                        logging.error(e)
+            tmp.seek(0)
+            return FileResponse(tmp, as_attachment=True, filename="all_logs.zip")
+        elif storage.isdir(current_path):
+            tmp = tempfile.TemporaryFile(suffix=".zip") # Removed when the response is closed
+            with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zip_file:
+                _zip_dir(zip_file, storage, current_path, "")
+            tmp.seek(0)
+            return FileResponse(tmp, as_attachment=True, filename=(storage.path.basename(current_path) or "logs") + ".zip")
+        elif storage.isfile(current_path):
+            return FileResponse(storage.open(current_path), as_attachment=True, filename=storage.path.basename(current_path))
+
+    # Fetch a byte range of a file (e.g. full content of a truncated record)
+    if request.GET.get("fetch") and source is not None:
+        try:
+            start = int(request.GET.get("start", 0))
+            end = int(request.GET.get("end", 0))
+        except ValueError:
+            return JsonResponse({"error": "start and end must be integers."}, status=400)
+        if not storage.isfile(current_path):
+            return JsonResponse({"error": "File does not exist."}, status=404)
+        content, truncated = _read_range(storage, current_path, start, end)
+        return JsonResponse({"content": content, "truncated": truncated})
 
     ###### Handle path changes ######
 
     # Just entered logs view
-    if not current_path:
-        items = []
-        for log_dir in log_dirs:
-            path = log_dir["path"]
-            is_dir = os.path.isdir(path)
-            errors_count = _count_errors_in_dir(path, request)
-
-            items.append({
-                "name": os.path.basename(path),
-                "path": path,
-                "is_dir": is_dir,
-                "errors_since_last_login": errors_count
-            })
-
-        if len(items) == 1: # Only one directory -> display its insights right away
-            drilled = _auto_drill_down(items[0]["path"])
-            return redirect(f"{request.path}?path={drilled}")
+    if source is None:
+        items = _list_items([(log_dir["path"], i) for i, log_dir in enumerate(log_dirs)], request, is_logs_dirs_list=True)
+
+        if len(items) == 1 and not items[0].get("unavailable"): # Only one directory -> display its insights right away
+            item_storage = _get_storage(items[0]["source"])
+            drilled = _auto_drill_down(item_storage.normpath(items[0]["path"]), item_storage)
+            params = {"path": drilled, "source": items[0]["source"]}
+            if search_query:
+                params["search_query"] = search_query
+            return redirect(f"{request.path}?{urlencode(params)}")
+
+        query_error = None
+        if search_query:
+            try:
+                items = _filter_items_by_query(items, search_query)
+            except ValueError as e:
+                query_error = str(e)
 
         return render(request, "admin/logs_dir.html", {
             "items": items,
             "current_path": current_path,
-            "breadcrumbs": _build_breadcrumbs(current_path, log_dirs),
+            "source": source,
+            "search_query": search_query,
+            "query_error": query_error,
+            "search_help": SEARCH_HELP,
+            "breadcrumbs": _build_breadcrumbs(current_path, source),
         })
 
-    current_path = os.path.abspath(current_path)
-    current_path = _auto_drill_down(current_path)
+    current_path = _auto_drill_down(current_path, storage)
 
     # Handle directories
-    if os.path.isdir(current_path):
-        items = []
-        for name in sorted(os.listdir(current_path)):
-            item_path = os.path.join(current_path, name)
-            is_dir = os.path.isdir(item_path)
-            errors_count = _count_errors_in_dir(item_path, request)
-
-            items.append({
-                "name": name,
-                "path": item_path,
-                "is_dir": is_dir,
-                "errors_since_last_login": errors_count,
-            })
+    if storage.isdir(current_path):
+        dirs, files = storage.listdir(current_path)
+        items = _list_items([(storage.path.join(current_path, name), source) for name in sorted(dirs + files)], request)
+
+        query_error = None
+        if search_query:
+            try:
+                items = _filter_items_by_query(items, search_query)
+            except ValueError as e:
+                query_error = str(e)
 
         return render(request, "admin/logs_dir.html", {
             "items": items,
             "current_path": current_path,
-            "breadcrumbs": _build_breadcrumbs(current_path, log_dirs),
+            "source": source,
+            "search_query": search_query,
+            "query_error": query_error,
+            "search_help": SEARCH_HELP,
+            "breadcrumbs": _build_breadcrumbs(current_path, source),
         })
     # Handle files
     else:
         rows_per_page = app_settings.LOGS_ROWS_PER_PAGE
         page_number = int(request.GET.get("page", 1))
-        search_query = request.GET.get("search_query", "").strip()
         level_filter = request.GET.get("level_filter", "").strip().lower()
         time_from = request.GET.get("time_from", "").strip()
         time_to = request.GET.get("time_to", "").strip()
 
-        with open(current_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-
-        # Find parser
-        parser_name = None
-        for entry in log_dirs:
-            if current_path.startswith(os.path.abspath(entry["path"])):
-                parser_name = entry.get("parser")
-                break
+        parser_name = _get_parser_name(source)
+        mode, column_names, column_types, all_rows, datetime_format = _parse_log_file(storage, current_path, parser_name)
 
-        mode, column_names, column_types, all_rows, datetime_format = _parse_logs(content, parser_name)
+        # Raw content is paginated by byte windows, newest (last) window by default
+        raw_window = None
+        if mode == ParseMode.RAW_CONTENT:
+            try:
+                offset = int(request.GET["offset"]) if request.GET.get("offset") else None
+                until = int(request.GET["until"]) if request.GET.get("until") else None
+            except ValueError:
+                offset, until = None, None
+            raw_window = _read_window(storage, current_path, offset, app_settings.LOGS_RAW_CONTENT_PAGE_BYTES, until)
 
         if all_rows:
             all_rows.reverse() # So new ones are at the top
 
-        # Filter by search query
-        if search_query:
-            filtered_rows = []
-            for row in all_rows:
-                if any(search_query.lower() in str(value).lower() for value in row):
-                    filtered_rows.append(row)
-            all_rows = filtered_rows
-
-        # Filter by level
-        if level_filter and column_types:
-            level_column_index = list(map(lambda e: e.lower(), column_types)).index("level")
-            if level_column_index >= 0:
-                filtered_rows = []
-                for row in all_rows:
-                    row_level = str(row[level_column_index]).lower()
-                    if row_level == level_filter:
-                        filtered_rows.append(row)
-                all_rows = filtered_rows
-
-        # Filter by time
-        if (time_from or time_to) and column_types:
-            time_column_index = list(map(lambda e: e.lower(), column_types)).index("time")
-            if time_column_index >= 0:
-                filtered_rows = []
-                for row in all_rows:
-                    row_time_str = str(row[time_column_index])
-
-                    row_time = datetime.strptime(row_time_str, datetime_format or DEFAULTS["datetime_format"])
-
-                    include = True
-                    if time_from:
-                        from_dt = datetime.fromisoformat(time_from)
-                        if row_time < from_dt:
-                            include = False
-                    if time_to:
-                        to_dt = datetime.fromisoformat(time_to)
-                        if row_time > to_dt:
-                            include = False
-                    if include:
-                        filtered_rows.append(row)
-                all_rows = filtered_rows
+        # Filter by search query, level and time with a single compiled predicate
+        query_error = None
+        try:
+            query = _compile_query(search_query, column_names, column_types, datetime_format, level_filter, time_from, time_to)
+            if all_rows:
+                all_rows = query.filter(all_rows)
+        except ValueError as e:
+            query_error = str(e)
+            all_rows = None
 
         if all_rows:
             paginator = Paginator(all_rows, rows_per_page)
             page_obj = paginator.get_page(page_number)
-            rows = page_obj.object_list
+            rows = [query.highlight(row) for row in page_obj.object_list]
         else:
             page_obj = None
             rows = None
 
         return render(request, "admin/logs_file.html", {
             "mode": mode,
-            "content": None if parser_name else content,
+            "raw_window": raw_window,
             "rows": rows,
             "column_names": column_names,
             "column_types": column_types,
             "current_path": current_path,
+            "source": source,
             "page_obj": page_obj,
             "search_query": search_query,
             "level_filter": level_filter,
-            "breadcrumbs": _build_breadcrumbs(current_path, log_dirs),
+            "time_from": time_from,
+            "time_to": time_to,
+            "query_error": query_error,
+            "search_help": SEARCH_HELP,
+            "breadcrumbs": _build_breadcrumbs(current_path, source),
         })
@@ -1,19 +1,9 @@
 import re
 from enum import Enum
 from django_admin_logs_viewer.conf import app_settings
+from django_admin_logs_viewer.regexes import LOGS_PREDEFINED_REGEXES # Backwards compatible import path
 
-class LOGS_PREDEFINED_REGEXES:
-    # JSON style log: {"level":"INFO","time":"2025-08-22T12:34:56","path":"/app","file":"app.py","message":"Something happened"}
-    json = r'^\{\s*"level"\s*:\s*"([^"]+)"\s*,\s*"datetime"\s*:\s*"([^"]+)"\s*,\s*"source"\s*:\s*"([^"]+)"\s*,\s*"file"\s*:\s*"([^"]+)"\s*,\s*"message"\s*:\s*"([^"]+)"\s*\}$'
-
-    # Comma-separated: Level,Time,Path,File,Message
-    comma_separated = r'^(.*?),(.*?),(.*?),(.*?),(.*)$'
-
-    # Space-separated simple log: [LEVEL] 2025-08-22T12:34:56 Message
-    simple_space = r'^\[(\w+)\]\s+(\S+)\s+(.*)$'
-
-    # Syslog format: Aug 22 12:34:56 hostname program[pid]: message
-    syslog = r'^(\w+\s+\d+\s+\d+:\d+:\d+)\s+(\S+)\s+(\S+)\[(\d+)\]:\s+(.*)$'
+TRUNCATED_MARKER = " [...]"
 
 class ParseMode(Enum):
     RAW_CONTENT = "raw_content"
@@ -25,7 +15,55 @@ def _get_parser_config(name):
         return user_parsers[name]
     raise ValueError(f"Parser '{name}' not found in LOGS_PARSERS.")
 
-def _parse_logs(content, parser_name):
+class LogRow(list):
+    """Row values plus the byte range of the record (`start`, `end`) and of its traceback (`traceback_start`, `end`)."""
+    def __init__(self, values, start, end=None, truncated=False):
+        super().__init__(values)
+        self.start = start
+        self.end = end
+        self.traceback_start = None
+        self.truncated = truncated
+
+def _iter_lines(file, max_line_length=None):
+    """
+    Yield (offset, line, truncated) for each line of a file opened in binary mode.
+    Lines longer than `max_line_length` bytes are cut and the rest is skipped without being kept in memory.
+    Lines are yielded without TRUNCATED_MARKER, so they can still be matched by `$` anchored patterns.
+    """
+    offset = 0
+    while True:
+        raw_line = file.readline(max_line_length) if max_line_length else file.readline()
+        if not raw_line:
+            break
+        line_offset = offset
+        offset += len(raw_line)
+        truncated = False
+        if max_line_length and not raw_line.endswith(b"\n"):
+            while True: # Skip the rest of the line
+                rest = file.readline(max_line_length)
+                if not rest:
+                    break
+                if rest not in (b"\n", b"\r\n"): # Only the line ending was left, nothing is lost
+                    truncated = True
+                offset += len(rest)
+                if rest.endswith(b"\n"):
+                    break
+        line = raw_line.decode("utf-8", errors="ignore").rstrip("\r\n")
+        yield line_offset, line, truncated
+
+def _mark_truncated(value, truncated):
+    return value + TRUNCATED_MARKER if truncated else value
+
+def _finish_row(row, traceback_lines, omitted_lines, end):
+    if omitted_lines:
+        traceback_lines.append(f"... {omitted_lines} more line(s) truncated")
+        row.truncated = True
+    row[-1] = "\n".join(traceback_lines)
+    row.end = end
+    return row
+
+def _parse_logs(file, parser_name):
+    """Parse a log file opened in binary mode."""
     if not parser_name:
         return ParseMode.RAW_CONTENT, None, None, None, None
 
@@ -34,29 +72,59 @@ def _parse_logs(content, parser_name):
     column_types = parser_config.get("column_types", [])
     pattern = parser_config["pattern"]
     datetime_format = parser_config.get("datetime_format")
+    max_line_length = app_settings.LOGS_MAX_LINE_LENGTH
+    max_traceback_lines = app_settings.LOGS_MAX_TRACEBACK_LINES
 
     regex = re.compile(pattern)
     rows = []
     current_row = None
+    traceback_lines = [] # Joined once per record instead of concatenating for every line
+    omitted_lines = 0
 
-    for line in content.splitlines():
+    for offset, line, truncated in _iter_lines(file, max_line_length):
         match = regex.match(line)
         if match:
             if current_row:
-                rows.append(current_row)
+                rows.append(_finish_row(current_row, traceback_lines, omitted_lines, offset))
             values = list(match.groups())
+            if values:
+                values[-1] = _mark_truncated(values[-1], truncated)
             values.append("") # Traceback
-            current_row = values
+            current_row = LogRow(values, offset, truncated=truncated)
+            traceback_lines = []
+            omitted_lines = 0
         else:
             if current_row:
-                current_row[-1] += ("\n" if current_row[-1] else "") + line
+                if current_row.traceback_start is None:
+                    current_row.traceback_start = offset
+                if truncated:
+                    current_row.truncated = True
+                if max_traceback_lines and len(traceback_lines) >= max_traceback_lines:
+                    omitted_lines += 1
+                else:
+                    traceback_lines.append(_mark_truncated(line, truncated))
             else:
-                rows.append([f"Unmatched line: {line}"])
+                row = LogRow([f"Unmatched line: {_mark_truncated(line, truncated)}"], offset, truncated=truncated)
+                rows.append(row)
 
+    end_offset = file.tell()
     if current_row:
-        rows.append(current_row)
+        rows.append(_finish_row(current_row, traceback_lines, omitted_lines, end_offset))
+
+    # Unmatched rows end where the next row starts
+    for row, next_row in zip(rows, rows[1:]):
+        if row.end is None:
+            row.end = next_row.start
+    if rows and rows[-1].end is None:
+        rows[-1].end = end_offset
 
     if column_names:
         column_names += ["Traceback"]
 
     return ParseMode.ROWS_AND_COLUMNS, column_names, column_types, rows, datetime_format
+
+def _parse_log_file(storage, path, parser_name):
+    if not parser_name:
+        return _parse_logs(None, parser_name)
+    with storage.open(path) as f:
+        return _parse_logs(f, parser_name)
@@ -0,0 +1,251 @@
+import copy
+import re
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+from django_admin_logs_viewer.conf import app_settings
+from django_admin_logs_viewer.defaults import DEFAULTS
+
+# Query syntax (terms are ANDed together):
+#   level:error                 -> column equals value (LEVEL column) / contains value (other columns)
+#   path=/app                   -> column equals value
+#   message~/timeout \d+ms/     -> regex search in column (also `message:/.../`)
+#   time>2025-08-22T10:00       -> time comparison (>, >=, <, <=) against the TIME column
+#                                  (an explicit offset, e.g. +02:00, is converted to LOGS_TIMEZONE)
+#   timeout                     -> substring search over all columns
+#   /timeout \d+ms/             -> regex search over all columns
+# Append `i` after a regex (e.g. /timeout/i) to make it case-insensitive.
+# Terms with an unknown field name are an error; terms which can't be field names (e.g. `12:34:56`,
+# `https://...`) and quoted terms (e.g. "level:error") are plain text.
+SEARCH_HELP = "Examples: level:error  message~/timeout \\d+ms/  time>2025-08-22T10:00  path=/app  some text"
+
+_TOKEN_RE = re.compile(r'''
+    (?:(?P<field>[A-Za-z_][\w.-]*)(?P<op>>=|<=|:|~|=|>|<))?
+    (?P<value>/(?:\\.|[^/\\])*/i?(?=\s|$)|"(?:\\.|[^"\\])*"|\S+)
+''', re.VERBOSE)
+
+_TIME_OPS = {
+    ">": lambda row_time, value: row_time > value,
+    ">=": lambda row_time, value: row_time >= value,
+    "<": lambda row_time, value: row_time < value,
+    "<=": lambda row_time, value: row_time <= value,
+}
+
+# Lower cost = evaluated first
+_COST_LEVEL = 0
+_COST_TIME = 1
+_COST_COLUMN = 2
+_COST_COLUMN_REGEX = 3
+_COST_ANY = 4
+_COST_ANY_REGEX = 5
+
+class LogQuery:
+    def __init__(self, predicates, highlights):
+        self._predicates = predicates
+        self._highlights = highlights
+
+    def __bool__(self):
+        return bool(self._predicates)
+
+    def matches(self, row):
+        for predicate in self._predicates:
+            if not predicate(row):
+                return False
+        return True
+
+    def filter(self, rows):
+        if not self._predicates:
+            return rows
+        return [row for row in rows if self.matches(row)]
+
+    def highlight(self, row):
+        """Return a copy of the row with matched fragments wrapped in <mark>."""
+        if not self._highlights:
+            return row
+
+        highlighted = copy.copy(row) # Keeps row attributes (e.g. byte offsets)
+        for index, value in enumerate(row):
+            value = str(value)
+            spans = []
+            for column_index, regex in self._highlights:
+                if column_index is None or column_index == index:
+                    spans.extend(m.span() for m in regex.finditer(value) if m.end() > m.start())
+            if spans:
+                highlighted[index] = _mark_spans(value, spans)
+        return highlighted
+
+def _mark_spans(value, spans):
+    spans.sort()
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    parts = []
+    position = 0
+    for start, end in merged:
+        parts.append(escape(value[position:start]))
+        parts.append(f"<mark>{escape(value[start:end])}</mark>")
+        position = end
+    parts.append(escape(value[position:]))
+    return mark_safe("".join(parts))
+
+def _normalize_field(name):
+    return re.sub(r"\W+", "_", name.strip().lower()).strip("_")
+
+def _build_field_map(column_names, column_types):
+    fields = {}
+    for index, column_name in enumerate(column_names or []):
+        fields.setdefault(_normalize_field(column_name), index)
+    for index, column_type in enumerate(column_types or []):
+        column_type = column_type.lower()
+        if column_type != "other":
+            fields[column_type] = index
+    return fields
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return re.sub(r'\\(.)', r'\1', value[1:-1])
+    return value
+
+def _compile_regex(value):
+    flags = 0
+    if value.endswith("/i"):
+        flags = re.IGNORECASE
+        value = value[:-1]
+    try:
+        return re.compile(value[1:-1], flags)
+    except re.error as e:
+        raise ValueError(f"Invalid regex {value}: {e}")
+
+def _is_regex(value):
+    return len(value) >= 3 and value[0] == "/" and (value.endswith("/") or value.endswith("/i"))
+
+def _cell(row, index):
+    if index < len(row) and len(row) > 1: # Single value rows are unmatched lines
+        return str(row[index])
+    return None
+
+def _parse_query_time(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid datetime '{value}'. Use ISO format, e.g. 2025-08-22T10:00.")
+
+def _to_log_time(value):
+    """Naive datetime in LOGS_TIMEZONE, comparable with times of the log records."""
+    if value.tzinfo is None:
+        return value
+    if not app_settings.LOGS_TIMEZONE:
+        raise ValueError(f"Datetime '{value.isoformat()}' has an offset, but LOGS_TIMEZONE is not set.")
+    return value.astimezone(ZoneInfo(app_settings.LOGS_TIMEZONE)).replace(tzinfo=None)
+
+def _make_time_predicate(index, bounds, datetime_format):
+    datetime_format = datetime_format or DEFAULTS["datetime_format"]
+    naive_bounds = [(op, _to_log_time(bound)) for op, bound in bounds] # For naive record times (the usual case)
+
+    def predicate(row):
+        value = _cell(row, index)
+        if value is None:
+            return False
+        try:
+            row_time = datetime.strptime(value, datetime_format)
+            for op, bound in (bounds if row_time.tzinfo else naive_bounds):
+                if not _TIME_OPS[op](row_time, bound):
+                    return False
+        except (ValueError, TypeError):
+            return False
+        return True
+    return predicate
+
+def _make_column_predicate(index, regex):
+    def predicate(row):
+        value = _cell(row, index)
+        return value is not None and regex.search(value) is not None
+    return predicate
+
+def _make_equals_predicate(index, expected):
+    expected = expected.lower()
+
+    def predicate(row):
+        value = _cell(row, index)
+        return value is not None and value.strip().lower() == expected
+    return predicate
+
+def _make_any_predicate(regex):
+    def predicate(row):
+        return any(regex.search(str(value)) for value in row)
+    return predicate
+
+def _compile_query(query, column_names=None, column_types=None, datetime_format=None,
+                   level_filter="", time_from="", time_to=""):
+    """
+    Compile a search query (and the form filters) into a single LogQuery.
+    Raises ValueError for malformed queries.
+    """
+    fields = _build_field_map(column_names, column_types)
+    predicates = [] # (cost, predicate)
+    highlights = [] # (column index or None for all columns, regex)
+    time_bounds = {} # column index -> [(op, datetime)]
+
+    terms = []
+    if level_filter and "level" in fields:
+        terms.append(("level", ":", level_filter))
+    if time_from and "time" in fields:
+        terms.append(("time", ">=", time_from))
+    if time_to and "time" in fields:
+        terms.append(("time", "<=", time_to))
+    for match in _TOKEN_RE.finditer(query or ""):
+        field, op, value = match.group("field"), match.group("op"), match.group("value")
+        if field and (not fields or (op == ":" and value.startswith("//"))):
+            field, op, value = None, None, match.group(0) # No columns to search in, or an URL -> plain text
+        elif field and _normalize_field(field) not in fields:
+            raise ValueError(
+                f"Unknown field '{field}'. Available fields: {', '.join(sorted(fields))}. "
+                f'Put the term in quotes to search for it as text, e.g. "{match.group(0)}".'
+            )
+        terms.append((field, op, value))
+
+    for field, op, value in terms:
+        if not field:
+            if _is_regex(value):
+                regex = _compile_regex(value)
+            else:
+                regex = re.compile(re.escape(_unquote(value)), re.IGNORECASE)
+            predicates.append((_COST_ANY_REGEX if _is_regex(value) else _COST_ANY, _make_any_predicate(regex)))
+            highlights.append((None, regex))
+            continue
+
+        field = _normalize_field(field)
+        index = fields[field]
+        is_time_column = column_types and index < len(column_types) and column_types[index].lower() == "time"
+        is_level_column = column_types and index < len(column_types) and column_types[index].lower() == "level"
+
+        if op in _TIME_OPS:
+            if not is_time_column:
+                raise ValueError(f"Operator '{op}' is only supported for the TIME column.")
+            time_bounds.setdefault(index, []).append((op, _parse_query_time(_unquote(value))))
+        elif op == "~" or _is_regex(value):
+            if not _is_regex(value):
+                value = f"/{value}/"
+            regex = _compile_regex(value)
+            predicates.append((_COST_COLUMN_REGEX, _make_column_predicate(index, regex)))
+            highlights.append((index, regex))
+        elif op == "=" or is_level_column:
+            value = _unquote(value)
+            predicates.append((_COST_LEVEL if is_level_column else _COST_COLUMN, _make_equals_predicate(index, value)))
+            highlights.append((index, re.compile(rf"^\s*{re.escape(value)}\s*$", re.IGNORECASE)))
+        else:
+            regex = re.compile(re.escape(_unquote(value)), re.IGNORECASE)
+            predicates.append((_COST_COLUMN, _make_column_predicate(index, regex)))
+            highlights.append((index, regex))
+
+    for index, bounds in time_bounds.items():
+        # All bounds on one column share a single strptime per row
+        predicates.append((_COST_TIME, _make_time_predicate(index, bounds, datetime_format)))
+
+    predicates.sort(key=lambda e: e[0]) # Cheap predicates first (stable sort keeps query order)
+    return LogQuery([predicate for _, predicate in predicates], highlights)
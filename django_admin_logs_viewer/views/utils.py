@@ -1,11 +1,24 @@
 import os
-import pytz
+import shutil
+import logging
+import posixpath
 from datetime import datetime
+from zoneinfo import ZoneInfo
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from django.core.files.storage import Storage
 from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.urls import reverse
-from .parser import _parse_logs
+from .parser import _parse_log_file
+from .query import _compile_query
 from django_admin_logs_viewer.conf import app_settings
 from django_admin_logs_viewer.defaults import DEFAULTS
+from django_admin_logs_viewer.storage import BaseLogStorage, LocalStorage, DjangoStorage
+
+logger = logging.getLogger(__name__)
+
+_local_storage = LocalStorage()
 
 def _count_errors_in_rows(all_rows, column_types, request, datetime_format=None):
     prev_login_str = request.session.get('previous_login')
@@ -18,10 +31,10 @@ def _count_errors_in_rows(all_rows, column_types, request, datetime_format=None)
     except Exception:
         return 0
 
-    log_tz = pytz.timezone(app_settings.LOGS_TIMEZONE)
+    log_tz = ZoneInfo(app_settings.LOGS_TIMEZONE)
 
     if timezone.is_naive(prev_login):
-        prev_login = log_tz.localize(prev_login)
+        prev_login = timezone.make_aware(prev_login, log_tz)
 
     errors_count = 0
     column_types_lower = [s.lower() for s in column_types]
@@ -38,7 +51,7 @@ def _count_errors_in_rows(all_rows, column_types, request, datetime_format=None)
             row_time = datetime.strptime(row_time_str, datetime_format or DEFAULTS["datetime_format"])
 
             if timezone.is_naive(row_time):
-                row_time = log_tz.localize(row_time)
+                row_time = timezone.make_aware(row_time, log_tz)
 
             if row_time < prev_login:
                 break
@@ -51,100 +64,250 @@ def _count_errors_in_rows(all_rows, column_types, request, datetime_format=None)
 
     return errors_count
 
-def _count_errors_in_dir(path, request):
+def _count_errors_in_dir(path, request, source):
     total_errors = 0
 
     if not getattr(app_settings, "LOGS_SHOW_ERRORS_SINCE_LAST_LOG_IN", False):
         return 0
 
-    if os.path.isfile(path):
-        # Find parser for this file
-        parser_name = None
-        for entry in app_settings.LOGS_DIRS:
-            if path.startswith(os.path.abspath(entry["path"])):
-                parser_name = entry.get("parser")
-                break
-
-        if not parser_name:
-            return 0
+    storage = _get_storage(source)
+    parser_name = _get_parser_name(source)
+    if not parser_name:
+        return 0
 
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
-        mode, column_names, column_types, all_rows, _ = _parse_logs(content, parser_name)
-        total_errors += _count_errors_in_rows(all_rows, column_types, request)
+    if storage.isfile(path):
+        mode, column_names, column_types, all_rows, datetime_format = _parse_log_file(storage, path, parser_name)
+        total_errors += _count_errors_in_rows(all_rows, column_types, request, datetime_format)
 
-    elif os.path.isdir(path):
-        for root, dirs, files in os.walk(path):
+    elif storage.isdir(path):
+        for root, dirs, files in storage.walk(path):
             for filename in files:
-                file_path = os.path.join(root, filename)
-                # Find parser for this file
-                parser_name = None
-                for entry in app_settings.LOGS_DIRS:
-                    if file_path.startswith(os.path.abspath(entry["path"])):
-                        parser_name = entry.get("parser")
-                        break
-
-                if not parser_name:
-                    continue
-
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                mode, column_names, column_types, all_rows, datetime_format = _parse_logs(content, parser_name)
+                file_path = storage.path.join(root, filename)
+                mode, column_names, column_types, all_rows, datetime_format = _parse_log_file(storage, file_path, parser_name)
                 total_errors += _count_errors_in_rows(all_rows, column_types, request, datetime_format)
 
     return total_errors
 
-def _build_breadcrumbs(current_path, log_dirs):
+def _count_matches_in_file(storage, path, parser_name, search_query):
+    mode, column_names, column_types, all_rows, datetime_format = _parse_log_file(storage, path, parser_name)
+    query = _compile_query(search_query, column_names, column_types, datetime_format)
+
+    count = 0
+    for row in all_rows:
+        if query.matches(row):
+            count += 1
+    return count
+
+def _count_matches_in_dir(path, search_query, source):
+    storage = _get_storage(source)
+    parser_name = _get_parser_name(source)
+    if not parser_name:
+        return 0
+
+    if storage.isfile(path):
+        return _count_matches_in_file(storage, path, parser_name, search_query)
+
+    total_matches = 0
+    for root, dirs, files in storage.walk(path):
+        for filename in files:
+            total_matches += _count_matches_in_file(storage, storage.path.join(root, filename), parser_name, search_query)
+    return total_matches
+
+def _map_concurrently(func, items):
+    """Run func for every item in worker threads (e.g. one per log host) and return the results in order."""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(app_settings.LOGS_MAX_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
+
+def _list_items(paths, request, is_logs_dirs_list=False):
+    """Build directory listing items for (path, source) pairs, counting errors on all hosts at once."""
+    request.session.get("previous_login") # Load the session before it is used from worker threads
+
+    def build_item(path_and_source):
+        path, item_source = path_and_source
+        storage = _get_storage(item_source)
+        item = {
+            "name": _get_log_dir_name(item_source) if is_logs_dirs_list else storage.path.basename(path),
+            "path": path,
+            "source": item_source,
+            "is_dir": False,
+            "errors_since_last_login": 0,
+        }
+        try:
+            item["is_dir"] = storage.isdir(path)
+            item["errors_since_last_login"] = _count_errors_in_dir(path, request, item_source)
+        except OSError as e: # E.g. host of a remote storage is down
+            logger.warning(e)
+            item["unavailable"] = str(e)
+        return item
+
+    return _map_concurrently(build_item, paths)
+
+def _filter_items_by_query(items, search_query):
+    """Keep only items (files or directories) containing records matching the query."""
+    def count_matches(item):
+        if item.get("unavailable"):
+            return 0
+        return _count_matches_in_dir(item["path"], search_query, item["source"])
+
+    for item, matches in zip(items, _map_concurrently(count_matches, items)):
+        item["matches"] = matches
+    return [item for item in items if item["matches"]]
+
+def _zip_dir(zip_file, storage, path, arc_root):
+    for root, dirs, files in storage.walk(path):
+        for filename in files:
+            file_path = storage.path.join(root, filename)
+            arcname = posixpath.join(arc_root, *_relative_parts(storage, file_path, path))
+            with storage.open(file_path) as src, zip_file.open(arcname, "w") as dst:
+                shutil.copyfileobj(src, dst)
+
+def _read_range(storage, path, start, end):
+    """Read the [start, end) byte range of a file, limited to LOGS_MAX_FETCH_BYTES."""
+    max_bytes = app_settings.LOGS_MAX_FETCH_BYTES
+    start = max(start, 0)
+    end = max(end, start)
+    truncated = bool(max_bytes) and end - start > max_bytes
+    if truncated:
+        end = start + max_bytes
+
+    data = storage.read_range(path, start, end)
+    return data.decode("utf-8", errors="ignore"), truncated
+
+def _read_window(storage, path, offset, size, until=None):
+    """
+    Read about `size` bytes starting at `offset` (or the last window when offset is None),
+    aligned to whole lines where possible. `until` limits the window, so a previous window
+    ends where the current one starts.
+    """
+    file_size = storage.stat(path)[1]
+    if offset is None:
+        offset = max(file_size - size, 0)
+    offset = min(max(offset, 0), file_size)
+    read_size = size if until is None else min(size, max(until - offset, 0))
+
+    at_line_start = True
+    if offset > 0: # Read one byte more to know if the window starts at the beginning of a line
+        data = storage.read_range(path, offset - 1, offset + read_size)
+        at_line_start = data[:1] == b"\n"
+        data = data[1:]
+    else:
+        data = storage.read_range(path, offset, offset + read_size)
+
+    start = offset
+    end = offset + len(data)
+
+    if not at_line_start: # Skip the partial first line
+        newline = data.find(b"\n")
+        if newline != -1:
+            data = data[newline + 1:]
+            start += newline + 1
+    if end < file_size: # Skip the partial last line
+        newline = data.rfind(b"\n")
+        if newline != -1:
+            end -= len(data) - newline - 1
+            data = data[:newline + 1]
+
+    return {
+        "content": data.decode("utf-8", errors="ignore"),
+        "start": start,
+        "end": end,
+        "file_size": file_size,
+        "previous_offset": max(start - size, 0) if start > 0 else None,
+        "next_offset": end if end < file_size else None,
+    }
+
+def _get_storage(source):
+    """Storage of the LOGS_DIRS entry with the given index. Local filesystem if not set."""
+    storage = app_settings.LOGS_DIRS[source].get("storage")
+    if storage is None:
+        return _local_storage
+    if isinstance(storage, dict): # {"BACKEND": "dotted.path", "OPTIONS": {...}}, like settings.STORAGES
+        storage = import_string(storage["BACKEND"])(**storage.get("OPTIONS", {}))
+    if isinstance(storage, (str, Storage)): # Alias from settings.STORAGES or a Django storage
+        return DjangoStorage(storage)
+    return storage
+
+def _get_parser_name(source):
+    return app_settings.LOGS_DIRS[source].get("parser")
+
+def _get_log_dir_name(source):
+    entry = app_settings.LOGS_DIRS[source]
+    if entry.get("name"):
+        return entry["name"]
+    storage = _get_storage(source)
+    name = storage.path.basename(storage.normpath(entry["path"])) or "/"
+    return f"{name} ({storage.host})" if storage.host else name
+
+def _find_log_dir(path, source=None):
+    """Index of the LOGS_DIRS entry containing path. Without source only local entries are considered."""
+    log_dirs = app_settings.LOGS_DIRS
+    if source not in (None, ""):
+        try:
+            candidates = [int(source)]
+        except ValueError:
+            return None
+        if not 0 <= candidates[0] < len(log_dirs):
+            return None
+    else:
+        candidates = [i for i, entry in enumerate(log_dirs) if entry.get("storage") is None]
+
+    for index in candidates:
+        storage = _get_storage(index)
+        if storage.is_inside(storage.normpath(path), storage.normpath(log_dirs[index]["path"])):
+            return index
+    return None
+
+def _logs_url(path, source):
+    return f"{reverse('logs_view')}?{urlencode({'path': path, 'source': source})}"
+
+def _relative_parts(storage, path, root):
+    parts = []
+    while path != root:
+        parent, name = storage.path.split(path)
+        if parent == path:
+            break
+        parts.insert(0, name)
+        path = parent
+    return parts
+
+def _build_breadcrumbs(current_path, source):
     breadcrumbs = [{
         'name': 'Logs directories',
         'url': reverse('logs_view')
     }]
-
-    current_path = os.path.normpath(current_path)
-    log_dirs = [os.path.normpath(d["path"]) for d in log_dirs]
-
-    for log_dir in log_dirs:
-        if current_path.startswith(log_dir):
-            relative_parts = os.path.relpath(current_path, log_dir).split(os.sep)
-            breadcrumbs.append({
-                'name': os.path.basename(log_dir),
-                'url': f"{reverse('logs_view')}?path={log_dir}"
-            })
-            accumulated_path = log_dir
-            for part in relative_parts:
-                if part == '.':
-                    continue
-                accumulated_path = os.path.join(accumulated_path, part)
-                breadcrumbs.append({
-                    'name': part,
-                    'url': f"{reverse('logs_view')}?path={accumulated_path}"
-                })
-            break
+    if source is None:
+        return breadcrumbs
+
+    storage = _get_storage(source)
+    log_dir = storage.normpath(app_settings.LOGS_DIRS[source]["path"])
+    breadcrumbs.append({
+        'name': _get_log_dir_name(source),
+        'url': _logs_url(log_dir, source)
+    })
+    accumulated_path = log_dir
+    for part in _relative_parts(storage, storage.normpath(current_path), log_dir):
+        accumulated_path = storage.path.join(accumulated_path, part)
+        breadcrumbs.append({
+            'name': part,
+            'url': _logs_url(accumulated_path, source)
+        })
 
     return breadcrumbs
 
-def _auto_drill_down(path):
+def _auto_drill_down(path, storage):
     """Keep going down if directory contains only one subdirectory and no files."""
     while True:
-        if not os.path.isdir(path):
+        if not storage.isdir(path):
             break
-        entries = sorted(os.listdir(path))
-        subdirs = [e for e in entries if os.path.isdir(os.path.join(path, e))]
-        files = [e for e in entries if os.path.isfile(os.path.join(path, e))]
+        subdirs, files = storage.listdir(path)
         if len(subdirs) == 1 and not files:
-            path = os.path.join(path, subdirs[0])
+            path = storage.path.join(path, subdirs[0])
         else:
             break
     return path
 
-def _is_inside_logs_dirs(path):
-    path = os.path.abspath(path)
-    for log_dir in app_settings.LOGS_DIRS:
-        allowed_path = os.path.abspath(log_dir["path"])
-        if os.path.commonpath([path, allowed_path]) == allowed_path:
-            return True
-    return False
-
 def _validate_settings():
     errors = []
 
@@ -152,8 +315,17 @@ def _validate_settings():
     if not app_settings.LOGS_DIRS or not isinstance(app_settings.LOGS_DIRS, list):
         errors.append("LOGS_DIRS must be a non-empty list of paths.")
     else:
-        for d in app_settings.LOGS_DIRS:
-            if not os.path.exists(d["path"]):
+        for i, d in enumerate(app_settings.LOGS_DIRS):
+            try:
+                storage = _get_storage(i)
+            except Exception as e:
+                errors.append(f"Invalid storage for log directory {d['path']}: {e}")
+                continue
+            if not isinstance(storage, BaseLogStorage):
+                errors.append(f"Invalid storage for log directory {d['path']}: {type(storage).__name__} is neither a log storage nor a Django Storage.")
+                continue
+            # Remote storages are checked when listed, so one unavailable host doesn't break the whole view
+            if storage is _local_storage and not os.path.exists(d["path"]):
                 errors.append(f"Log directory does not exist: {d['path']}")
 
     # --- LOGS_PARSERS ---
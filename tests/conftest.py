@@ -0,0 +1,16 @@
+# Lets pytest run the tests without pytest-django. They also run with `python -m django test --settings=tests.settings`
+import os
+import django
+import pytest
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+django.setup()
+
+@pytest.fixture(scope="session", autouse=True)
+def django_test_environment():
+    from django.test.utils import setup_test_environment, teardown_test_environment, setup_databases, teardown_databases
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    yield
+    teardown_databases(old_config, verbosity=0)
+    teardown_test_environment()
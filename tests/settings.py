@@ -0,0 +1,60 @@
+from django_admin_logs_viewer import LOGS_PREDEFINED_REGEXES
+
+SECRET_KEY = "tests"
+DEBUG = False
+ALLOWED_HOSTS = ["testserver"]
+
+INSTALLED_APPS = [
+    "django_admin_logs_viewer",
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+]
+
+MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+]
+
+ROOT_URLCONF = "tests.urls"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+                "django_admin_logs_viewer.context_processors.logs_url",
+            ],
+        },
+    },
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+USE_TZ = True
+STATIC_URL = "static/"
+
+LOGS_PARSERS = {
+    "simple-parser": {
+        "pattern": LOGS_PREDEFINED_REGEXES.simple_space,
+        "column_names": ["Level", "Time", "Message"],
+        "column_types": ["LEVEL", "TIME", "OTHER"],
+        "datetime_format": "%Y-%m-%dT%H:%M:%S",
+    }
+}
+LOGS_AGENT_TOKEN = "test-token"
+LOGS_DIRS = [] # Set by tests
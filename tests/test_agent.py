@@ -0,0 +1,175 @@
+import http.client
+import os
+import socket
+import tempfile
+import threading
+import time
+from unittest import mock
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django_admin_logs_viewer.agent import LogsAgentHandler, make_agent_server
+from django_admin_logs_viewer.storage import RemoteStorage
+
+LOG_CONTENT = (
+    "[INFO] 2025-08-22T10:00:00 started\n"
+    "[ERROR] 2025-08-22T10:00:01 connection reset\n"
+    "[INFO] 2025-08-22T10:00:02 stopped\n"
+)
+
+def _make_logs_dir(test_case):
+    logs_dir = tempfile.TemporaryDirectory()
+    test_case.addClassCleanup(logs_dir.cleanup)
+    with open(os.path.join(logs_dir.name, "app.log"), "w") as f:
+        f.write(LOG_CONTENT)
+    return logs_dir.name
+
+def _start_agent(test_case, roots, token="test-token"):
+    server = make_agent_server(roots, token, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    test_case.addClassCleanup(server.server_close)
+    test_case.addClassCleanup(server.shutdown)
+    return server
+
+def _agent_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+def _unreachable_url():
+    with socket.socket() as s: # Free port nobody listens on
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+class RemoteStorageTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logs_dir = _make_logs_dir(cls)
+        cls.log_path = os.path.join(cls.logs_dir, "app.log")
+        cls.server = _start_agent(cls, [cls.logs_dir])
+        cls.storage = RemoteStorage(_agent_url(cls.server), token="test-token")
+
+    def test_wrong_token_is_forbidden(self):
+        storage = RemoteStorage(_agent_url(self.server), token="wrong")
+        with self.assertRaisesMessage(OSError, "returned 403"):
+            storage.stat(self.log_path)
+
+    def test_path_outside_roots_is_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            self.storage.stat(os.path.join(self.logs_dir, "..", "app.log"))
+        with self.assertRaises(FileNotFoundError):
+            self.storage.read_range("/etc/passwd", 0, 10)
+
+    def test_listing(self):
+        self.assertEqual(self.storage.listdir(self.logs_dir), ([], ["app.log"]))
+        self.assertTrue(self.storage.isfile(self.log_path))
+        self.assertEqual(self.storage.stat(self.log_path)[1], len(LOG_CONTENT))
+
+    def test_ranged_reads(self):
+        data = LOG_CONTENT.encode()
+        self.assertEqual(self.storage.read_range(self.log_path, 5, 15), data[5:15])
+        self.assertEqual(self.storage.read_range(self.log_path, 0, 10_000_000_000), data) # Split into bounded requests
+        self.assertEqual(self.storage.read_range(self.log_path, len(data) + 10, len(data) + 20), b"")
+
+        with self.storage.open(self.log_path) as f:
+            f.seek(len(data.splitlines(keepends=True)[0]))
+            self.assertEqual(f.readline(), data.splitlines(keepends=True)[1])
+
+    def test_agent_rejects_invalid_ranges(self):
+        too_big = LogsAgentHandler.max_read_bytes + 1
+        for start, end in [(-1, 10), (10, 5), (0, too_big)]:
+            with self.subTest(start=start, end=end), self.assertRaisesMessage(OSError, "returned 400"):
+                self.storage._request("read", path=self.log_path, start=start, end=end)
+
+    def test_non_ascii_authorization_is_forbidden(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=5)
+        self.addCleanup(connection.close)
+        connection.putrequest("GET", "/stat?path=" + self.log_path)
+        connection.putheader("Authorization", "Bearer zażółć".encode())
+        connection.endheaders()
+        self.assertEqual(connection.getresponse().status, 403)
+
+class AgentSymlinkTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logs_dir = _make_logs_dir(cls)
+        cls.outside_dir = _make_logs_dir(cls)
+        os.symlink(cls.outside_dir, os.path.join(cls.logs_dir, "outside"))
+        os.symlink(os.path.join(cls.outside_dir, "app.log"), os.path.join(cls.logs_dir, "outside.log"))
+        cls.linked_root = os.path.join(cls.outside_dir, "linked_root") # Symlink to the root itself
+        os.symlink(cls.logs_dir, cls.linked_root)
+
+        cls.server = _start_agent(cls, [cls.logs_dir, cls.linked_root])
+        cls.storage = RemoteStorage(_agent_url(cls.server), token="test-token")
+
+    def test_symlinks_leading_outside_roots_are_not_found(self):
+        for path in [os.path.join(self.logs_dir, "outside", "app.log"), os.path.join(self.logs_dir, "outside.log")]:
+            with self.subTest(path=path):
+                with self.assertRaises(FileNotFoundError):
+                    self.storage.read_range(path, 0, 10)
+                with self.assertRaises(FileNotFoundError):
+                    self.storage.stat(path)
+
+    def test_symlinked_root(self):
+        self.assertEqual(self.storage.read_range(os.path.join(self.linked_root, "app.log"), 0, 6), LOG_CONTENT[:6].encode())
+
+class ConnectionPoolTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logs_dir = _make_logs_dir(cls)
+        cls.server = _start_agent(cls, [cls.logs_dir])
+        cls.storage = RemoteStorage(_agent_url(cls.server), token="test-token")
+
+    def setUp(self):
+        while not self.storage._pool._idle.empty(): # Every test starts without pooled connections
+            self.storage._pool._idle.get_nowait().close()
+
+    def test_connection_is_reused(self):
+        self.storage.listdir(self.logs_dir)
+        connection = self.storage._pool._idle.queue[-1]
+        self.storage.listdir(self.logs_dir)
+        self.assertEqual(list(self.storage._pool._idle.queue), [connection])
+
+    def test_connection_closed_by_agent_is_replaced(self):
+        with mock.patch.object(LogsAgentHandler, "timeout", 0.2): # Agent closes idle keep-alive connections
+            self.storage.listdir(self.logs_dir)
+            connection = self.storage._pool._idle.queue[-1]
+            time.sleep(0.5)
+            self.assertEqual(self.storage.listdir(self.logs_dir), ([], ["app.log"]))
+        self.assertEqual(len(self.storage._pool._idle.queue), 1)
+        self.assertIsNot(self.storage._pool._idle.queue[-1], connection)
+
+@override_settings(LOGS_AGENT_TOKEN="test-token")
+class RemoteLogsViewTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logs_dir = _make_logs_dir(cls)
+        cls.server = _start_agent(cls, [cls.logs_dir])
+
+    def setUp(self):
+        user = User.objects.create_user("admin", is_staff=True)
+        self.client.force_login(user)
+
+    def _logs_dirs(self, url):
+        return [
+            {"path": self.logs_dir, "parser": "simple-parser"},
+            {
+                "path": self.logs_dir,
+                "parser": "simple-parser",
+                "storage": {"BACKEND": "django_admin_logs_viewer.storage.RemoteStorage", "OPTIONS": {"url": url}},
+            },
+        ]
+
+    def test_remote_file(self):
+        with self.settings(LOGS_DIRS=self._logs_dirs(_agent_url(self.server))):
+            response = self.client.get("/admin/logs/", {"path": os.path.join(self.logs_dir, "app.log"), "source": 1, "search_query": "level:error"})
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "connection reset")
+        self.assertNotContains(response, "stopped")
+
+    def test_unreachable_host_is_unavailable(self):
+        with self.settings(LOGS_DIRS=self._logs_dirs(_unreachable_url())):
+            response = self.client.get("/admin/logs/")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Unavailable")
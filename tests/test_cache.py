@@ -0,0 +1,85 @@
+import os
+import time
+from django.test import override_settings
+from .test_logs_view import LogsViewTestCase
+
+DAY = 24 * 60 * 60
+
+class ConditionalCacheTests(LogsViewTestCase):
+    def make_file(self, name, age):
+        path = os.path.join(self.logs_dir, name)
+        with open(path, "w") as f:
+            f.write("[INFO] 2025-08-22T10:00:00 rotated\n")
+        self.addCleanup(os.remove, path)
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_validators(self):
+        response = self.get(path=self.log_path)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"])
+        self.assertTrue(response["Last-Modified"])
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+        self.assertEqual(response["Vary"], "Cookie")
+
+    def test_not_modified(self):
+        response = self.get(path=self.log_path)
+        for headers in [{"if_none_match": response["ETag"]}, {"if_modified_since": response["Last-Modified"]}]:
+            with self.subTest(headers=headers):
+                cached = self.client.get("/admin/logs/", {"path": self.log_path}, headers=headers)
+                self.assertEqual(cached.status_code, 304)
+                self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_download_not_modified(self):
+        response = self.get(path=self.log_path, download=1)
+        self.assertEqual(b"".join(response.streaming_content).decode().count("\n"), 5)
+        cached = self.client.get("/admin/logs/", {"path": self.log_path, "download": 1}, headers={"if_none_match": response["ETag"]})
+        self.assertEqual(cached.status_code, 304)
+
+    def test_modified_file(self):
+        path = self.make_file("modified.log", 60)
+        response = self.get(path=path)
+
+        with open(path, "a") as f:
+            f.write("[INFO] 2025-08-22T10:00:01 appended\n")
+        headers = {"if_none_match": response["ETag"], "if_modified_since": response["Last-Modified"]}
+        modified = self.client.get("/admin/logs/", {"path": path}, headers=headers)
+        self.assertEqual(modified.status_code, 200)
+        self.assertNotEqual(modified["ETag"], response["ETag"])
+        self.assertContains(modified, "appended")
+
+    def test_etag_depends_on_params_and_settings(self):
+        etag = self.get(path=self.log_path)["ETag"]
+        self.assertNotEqual(self.get(path=self.log_path, search_query="failed")["ETag"], etag)
+        self.assertNotEqual(self.get(path=self.log_path, page=2)["ETag"], etag)
+        for name, value in [("LOGS_ROWS_PER_PAGE", 1), ("LOGS_TIMEZONE", "Europe/Warsaw"), ("LOGS_MAX_LINE_LENGTH", 10)]:
+            with self.subTest(setting=name), override_settings(**{name: value}):
+                self.assertNotEqual(self.get(path=self.log_path)["ETag"], etag)
+        self.assertEqual(self.get(path=self.log_path)["ETag"], etag)
+
+    def test_rotated_file_is_cached(self):
+        path = self.make_file("app.log.2025-08-22", 2 * DAY)
+        response = self.get(path=path)
+        self.assertEqual(response["Cache-Control"], f"private, max-age={30 * DAY}")
+
+    def test_recently_modified_rotated_file_is_revalidated(self):
+        path = self.make_file("app.log.2025-08-22", 60) # E.g. today's file of a handler writing dated files directly
+        self.assertEqual(self.get(path=path)["Cache-Control"], "private, no-cache")
+        with override_settings(LOGS_ROTATED_FILE_MIN_AGE=30):
+            self.assertEqual(self.get(path=path)["Cache-Control"], f"private, max-age={30 * DAY}")
+
+    def test_numbered_file_is_revalidated(self):
+        path = self.make_file("app.log.1", 2 * DAY) # Gets new content on every rollover
+        self.assertEqual(self.get(path=path)["Cache-Control"], "private, no-cache")
+
+    @override_settings(LOGS_ROTATED_FILE_PATTERN=None)
+    def test_rotated_files_can_be_disabled(self):
+        path = self.make_file("app.log.2025-08-22", 2 * DAY)
+        self.assertEqual(self.get(path=path)["Cache-Control"], "private, no-cache")
+
+    @override_settings(LOGS_DIRS=None)
+    def test_invalid_settings_show_errors(self):
+        response = self.get(path=self.log_path)
+        self.assertContains(response, "LOGS_DIRS must be a non-empty list of paths.")
+        self.assertNotIn("ETag", response)
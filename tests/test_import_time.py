@@ -0,0 +1,65 @@
+import json
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+# Loading the URLconf (e.g. by management commands) must stay cheap, views are imported on the first request
+IMPORT_TIME_BUDGET_US = 10_000
+DEFERRED_MODULES = ["concurrent.futures", "zipfile", "http.client"]
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import json, sys
+import django
+django.setup()
+modules = set(sys.modules)
+import django_admin_logs_viewer.urls
+from django.urls import resolve
+resolve("/", urlconf="django_admin_logs_viewer.urls")
+print(json.dumps(sorted(set(sys.modules) - modules)))
+"""
+
+_IMPORT_TIME_RE = re.compile(r"^import time:\s*\d+ \|\s*(\d+) \|( *)(\S+)$")
+
+def _is_package_module(name):
+    return name == "django_admin_logs_viewer" or name.startswith("django_admin_logs_viewer.")
+
+def _package_import_time(importtime_output):
+    """Sum of cumulative times (us) of django_admin_logs_viewer modules, not counting the nested ones twice."""
+    total = 0
+    enclosing = [] # (depth, is package module)
+    for line in reversed(importtime_output.splitlines()): # Parents are printed after their children
+        match = _IMPORT_TIME_RE.match(line)
+        if not match:
+            continue
+        cumulative, depth, name = int(match[1]), len(match[2]), match[3]
+        while enclosing and enclosing[-1][0] >= depth:
+            enclosing.pop()
+        if _is_package_module(name) and not any(is_package for _, is_package in enclosing):
+            total += cumulative
+        enclosing.append((depth, _is_package_module(name)))
+    return total
+
+def _load_urlconf():
+    """Return (modules imported by loading the URLconf, package import time in us) measured in a new interpreter."""
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings", "PYTHONPATH": ROOT_DIR}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout), _package_import_time(result.stderr)
+
+class ImportTimeTests(unittest.TestCase):
+    def test_urlconf_does_not_import_views(self):
+        imported, _ = _load_urlconf()
+        self.assertEqual([name for name in imported if name.startswith("django_admin_logs_viewer.views")], [])
+        # Django itself may have imported them already, so only modules imported by the URLconf are checked
+        self.assertEqual([name for name in DEFERRED_MODULES if name in imported], [])
+
+    def test_import_time_budget(self):
+        import_time = min(_load_urlconf()[1] for _ in range(3)) # Best of 3, less sensitive to a busy machine
+        self.assertGreater(import_time, 0)
+        self.assertLess(import_time, IMPORT_TIME_BUDGET_US)
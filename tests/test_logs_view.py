@@ -0,0 +1,163 @@
+import os
+import tempfile
+from django.contrib.auth.models import User
+from django.core.files.storage import FileSystemStorage
+from django.test import SimpleTestCase, TestCase, override_settings
+from django_admin_logs_viewer.storage import LocalStorage
+from django_admin_logs_viewer.views.utils import _read_window
+
+LOG_CONTENT = (
+    "[INFO] 2025-08-22T10:00:00 started\n"
+    "[ERROR] 2025-08-22T10:00:01 failed\n"
+    "Traceback (most recent call last):\n"
+    "  line 1\n"
+    "[INFO] 2025-08-22T10:00:02 stopped\n"
+)
+
+def _offset(text):
+    return LOG_CONTENT.index(text)
+
+class LogsViewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        logs_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(logs_dir.cleanup)
+        cls.logs_dir = logs_dir.name
+        cls.log_path = os.path.join(cls.logs_dir, "app.log")
+        with open(cls.log_path, "w") as f:
+            f.write(LOG_CONTENT)
+        os.mkdir(os.path.join(cls.logs_dir, "old"))
+
+    def setUp(self):
+        settings_override = override_settings(LOGS_DIRS=[{"path": self.logs_dir, "parser": "simple-parser"}])
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        user = User.objects.create_user("admin", is_staff=True)
+        self.client.force_login(user)
+
+    def get(self, **params):
+        return self.client.get("/admin/logs/", params)
+
+class FetchTests(LogsViewTestCase):
+    def test_record(self):
+        start, end = _offset("[ERROR]"), _offset("[INFO] 2025-08-22T10:00:02")
+        response = self.get(path=self.log_path, fetch=1, start=start, end=end)
+        self.assertEqual(response.json(), {"content": LOG_CONTENT[start:end], "truncated": False})
+
+    @override_settings(LOGS_MAX_FETCH_BYTES=10)
+    def test_limited_by_max_fetch_bytes(self):
+        response = self.get(path=self.log_path, fetch=1, start=5, end=100)
+        self.assertEqual(response.json(), {"content": LOG_CONTENT[5:15], "truncated": True})
+
+    def test_file_page_links_record_offsets(self):
+        response = self.get(path=self.log_path)
+        self.assertContains(response, f"toggleTraceback(this, {_offset('Traceback')}, {_offset('[INFO] 2025-08-22T10:00:02')})")
+
+    def test_directory_is_not_found(self):
+        response = self.get(path=os.path.join(self.logs_dir, "old"), fetch=1, start=0, end=10)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"error": "File does not exist."})
+
+    def test_missing_file_is_not_found(self):
+        response = self.get(path=os.path.join(self.logs_dir, "missing.log"), fetch=1, start=0, end=10)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"error": "File does not exist."})
+
+    def test_invalid_range(self):
+        response = self.get(path=self.log_path, fetch=1, start="a", end=10)
+        self.assertEqual(response.status_code, 400)
+
+class DjangoStorageTests(LogsViewTestCase):
+    def test_storage_instance(self):
+        with self.settings(LOGS_DIRS=[{"path": "", "parser": "simple-parser", "storage": FileSystemStorage(location=self.logs_dir)}]):
+            listing = self.client.get("/admin/logs/", follow=True) # Single entry, redirected to its directory
+            response = self.get(path="app.log", source=0, search_query="level:error")
+        self.assertContains(listing, "app.log")
+        self.assertContains(response, "failed")
+        self.assertNotContains(response, "stopped")
+
+    def test_invalid_storage(self):
+        with self.settings(LOGS_DIRS=[{"path": "", "storage": object()}]):
+            response = self.get()
+        self.assertContains(response, "object is neither a log storage nor a Django Storage.")
+
+class RawContentTests(LogsViewTestCase):
+    def setUp(self):
+        super().setUp()
+        settings_override = override_settings(LOGS_DIRS=[{"path": self.logs_dir}], LOGS_RAW_CONTENT_PAGE_BYTES=40)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_last_window_by_default(self):
+        window = self.get(path=self.log_path).context["raw_window"]
+        self.assertEqual(window["content"], "[INFO] 2025-08-22T10:00:02 stopped\n")
+        self.assertEqual((window["end"], window["file_size"], window["next_offset"]), (len(LOG_CONTENT), len(LOG_CONTENT), None))
+
+    def test_offset_param(self):
+        window = self.get(path=self.log_path, offset=0).context["raw_window"]
+        self.assertEqual(window["content"], "[INFO] 2025-08-22T10:00:00 started\n")
+        self.assertEqual((window["previous_offset"], window["next_offset"]), (None, _offset("[ERROR]")))
+
+        self.assertEqual(self.get(path=self.log_path, offset="a").context["raw_window"]["end"], len(LOG_CONTENT))
+
+    def test_previous_window_ends_at_current_one(self):
+        response = self.get(path=self.log_path, offset=_offset("[ERROR]"))
+        window = response.context["raw_window"]
+        self.assertEqual(window["content"], "[ERROR] 2025-08-22T10:00:01 failed\n")
+        self.assertContains(response, f"?path={self.log_path.replace('/', '%2F')}&amp;offset=0&amp;until={window['start']}")
+
+        window = self.get(path=self.log_path, offset=0, until=_offset("[ERROR]")).context["raw_window"]
+        self.assertEqual(window["content"], "[INFO] 2025-08-22T10:00:00 started\n")
+
+class ReadWindowTests(SimpleTestCase):
+    storage = LocalStorage()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        logs_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(logs_dir.cleanup)
+        cls.data = "".join(f"line {i}{'!' * (i % 4)}\n" for i in range(30))
+        cls.path = os.path.join(logs_dir.name, "raw.log")
+        with open(cls.path, "w") as f:
+            f.write(cls.data)
+
+    def assertWindow(self, window):
+        self.assertEqual(window["content"], self.data[window["start"]:window["end"]])
+        self.assertTrue(window["start"] == 0 or self.data[window["start"] - 1] == "\n")
+        self.assertTrue(window["content"].endswith("\n"))
+
+    def test_windows_are_aligned_to_lines(self):
+        for offset in [None, 0, 1, 7, 8, 33, len(self.data) - 1, len(self.data), len(self.data) + 100, -5]:
+            with self.subTest(offset=offset):
+                window = _read_window(self.storage, self.path, offset, 25)
+                if window["content"]:
+                    self.assertWindow(window)
+                self.assertEqual(window["file_size"], len(self.data))
+
+    def test_next_offsets_cover_the_file(self):
+        offset, contents = 0, []
+        while offset is not None:
+            window = _read_window(self.storage, self.path, offset, 25)
+            self.assertWindow(window)
+            self.assertEqual(window["start"], offset)
+            contents.append(window["content"])
+            offset = window["next_offset"]
+        self.assertEqual("".join(contents), self.data)
+
+    def test_previous_offsets_cover_the_file(self):
+        window = _read_window(self.storage, self.path, None, 25)
+        contents = [window["content"]]
+        while window["previous_offset"] is not None:
+            start = window["start"]
+            window = _read_window(self.storage, self.path, window["previous_offset"], 25, until=start)
+            self.assertWindow(window)
+            self.assertEqual(window["end"], start)
+            contents.append(window["content"])
+        self.assertEqual("".join(reversed(contents)), self.data)
+
+    def test_line_longer_than_window(self):
+        window = _read_window(self.storage, self.path, 0, 5)
+        self.assertEqual((window["content"], window["start"], window["end"], window["next_offset"]), ("line ", 0, 5, 5))
@@ -0,0 +1,107 @@
+import io
+from django.test import SimpleTestCase, override_settings
+from django_admin_logs_viewer.views.parser import _iter_lines, _parse_logs, ParseMode, TRUNCATED_MARKER
+
+LINES = [
+    b"garbage before the first record\n",
+    b"[INFO] 2025-08-22T10:00:00 started\n",
+    b"[ERROR] 2025-08-22T10:00:01 failed\n",
+    b"Traceback (most recent call last):\n",
+    b"  line 1\n",
+    b"  line 2\n",
+    b"[INFO] 2025-08-22T10:00:02 " + b"x" * 100 + b"\n",
+    b"[INFO] 2025-08-22T10:00:03 stopped",
+]
+DATA = b"".join(LINES)
+
+def _offset(line_index):
+    return sum(len(line) for line in LINES[:line_index])
+
+def _parse(data=DATA, parser_name="simple-parser"):
+    return _parse_logs(io.BytesIO(data), parser_name)
+
+class IterLinesTests(SimpleTestCase):
+    def test_lines_and_offsets(self):
+        self.assertEqual(list(_iter_lines(io.BytesIO(b"ab\r\ncd\n\nef"))), [(0, "ab", False), (4, "cd", False), (7, "", False), (8, "ef", False)])
+
+    def test_long_lines_are_cut(self):
+        self.assertEqual(list(_iter_lines(io.BytesIO(b"abcdefghij\nkl\n"), 4)), [(0, "abcd", True), (11, "kl", False)])
+
+    def test_lines_of_exactly_max_length_are_not_truncated(self):
+        self.assertEqual(list(_iter_lines(io.BytesIO(b"abcd\nefgh"), 4)), [(0, "abcd", False), (5, "efgh", False)])
+        self.assertEqual(list(_iter_lines(io.BytesIO(b"abc\r\nefgh\r\n"), 4)), [(0, "abc", False), (5, "efgh", False)])
+        self.assertEqual(list(_iter_lines(io.BytesIO(b"abcd"), 4)), [(0, "abcd", False)])
+
+class ParseLogsTests(SimpleTestCase):
+    def test_without_parser(self):
+        self.assertEqual(_parse_logs(None, None), (ParseMode.RAW_CONTENT, None, None, None, None))
+
+    def test_rows_and_byte_offsets(self):
+        mode, column_names, column_types, rows, datetime_format = _parse()
+
+        self.assertEqual(mode, ParseMode.ROWS_AND_COLUMNS)
+        self.assertEqual(column_names, ["Level", "Time", "Message", "Traceback"])
+        self.assertEqual(datetime_format, "%Y-%m-%dT%H:%M:%S")
+        self.assertEqual([row[0] for row in rows], ["Unmatched line: garbage before the first record", "INFO", "ERROR", "INFO", "INFO"])
+        self.assertEqual([(row.start, row.end) for row in rows], [
+            (0, _offset(1)),
+            (_offset(1), _offset(2)),
+            (_offset(2), _offset(6)),
+            (_offset(6), _offset(7)),
+            (_offset(7), len(DATA)),
+        ])
+        self.assertEqual(rows[2][3], "Traceback (most recent call last):\n  line 1\n  line 2")
+        self.assertEqual(rows[2].traceback_start, _offset(3))
+        self.assertEqual(DATA[rows[2].traceback_start:rows[2].end], b"".join(LINES[3:6]))
+        self.assertIsNone(rows[1].traceback_start)
+        self.assertFalse(any(row.truncated for row in rows))
+
+    @override_settings(LOGS_MAX_LINE_LENGTH=50)
+    def test_long_lines_are_truncated(self):
+        rows = _parse()[3]
+
+        self.assertEqual(rows[0][0], "Unmatched line: garbage before the first record")
+        self.assertEqual(rows[3][2], "x" * 23 + TRUNCATED_MARKER)
+        self.assertTrue(rows[3].truncated)
+        self.assertEqual((rows[3].start, rows[3].end), (_offset(6), _offset(7))) # Offsets of the full record
+        self.assertEqual([row.truncated for row in rows], [False, False, False, True, False])
+
+    @override_settings(LOGS_MAX_LINE_LENGTH=30)
+    def test_truncated_traceback_and_unmatched_lines_are_marked(self):
+        rows = _parse()[3]
+
+        self.assertEqual(rows[0][0], "Unmatched line: garbage before the first recor" + TRUNCATED_MARKER)
+        self.assertEqual(rows[2][2], "fa" + TRUNCATED_MARKER)
+        self.assertEqual(rows[2][3], "Traceback (most recent call la" + TRUNCATED_MARKER + "\n  line 1\n  line 2")
+        self.assertEqual([(row.start, row.end) for row in rows], [
+            (0, _offset(1)),
+            (_offset(1), _offset(2)),
+            (_offset(2), _offset(6)),
+            (_offset(6), _offset(7)),
+            (_offset(7), len(DATA)),
+        ])
+        self.assertEqual([row.truncated for row in rows], [True, True, True, True, True])
+
+    @override_settings(LOGS_MAX_LINE_LENGTH=50, LOGS_PARSERS={
+        "words-parser": {"pattern": r"^\[(\w+)\]\s+(\S+)\s+(\w+)$", "column_names": ["Level", "Time", "Message"]},
+    })
+    def test_truncated_lines_match_anchored_patterns(self):
+        rows = _parse(parser_name="words-parser")[3]
+
+        self.assertEqual([row[0] for row in rows[1:]], ["INFO", "ERROR", "INFO", "INFO"])
+        self.assertEqual(rows[3][2], "x" * 23 + TRUNCATED_MARKER)
+        self.assertEqual(rows[2][3], "Traceback (most recent call last):\n  line 1\n  line 2")
+
+    @override_settings(LOGS_MAX_TRACEBACK_LINES=1)
+    def test_long_tracebacks_are_truncated(self):
+        rows = _parse()[3]
+
+        self.assertEqual(rows[2][3], "Traceback (most recent call last):\n... 2 more line(s) truncated")
+        self.assertTrue(rows[2].truncated)
+        self.assertEqual((rows[2].traceback_start, rows[2].end), (_offset(3), _offset(6)))
+
+    @override_settings(LOGS_MAX_LINE_LENGTH=None, LOGS_MAX_TRACEBACK_LINES=None)
+    def test_limits_can_be_disabled(self):
+        rows = _parse()[3]
+        self.assertEqual(rows[3][2], "x" * 100)
+        self.assertFalse(any(row.truncated for row in rows))
@@ -0,0 +1,111 @@
+from django.test import SimpleTestCase, override_settings
+from django_admin_logs_viewer.views.parser import LogRow
+from django_admin_logs_viewer.views.query import _compile_query
+
+COLUMN_NAMES = ["Level", "Time", "Path", "File & Line No", "Message", "Traceback"]
+COLUMN_TYPES = ["LEVEL", "TIME", "OTHER", "OTHER", "OTHER"]
+
+ROWS = [
+    ["ERROR", "2025-08-22 10:30:00,000", "/app", "views.py:12", "timeout 150ms at 12:34:56", ""],
+    ["INFO", "2025-08-22 08:30:00,000", "/app/api", "api.py:3", "see https://example.com", ""],
+    ["WARNING", "2025-08-22 12:00:00,000", "/other", "tasks.py:7", "connection reset", "Traceback ..."],
+    ["Unmatched line: level:error"],
+]
+
+def _search(query, **kwargs):
+    return [row[4] for row in _compile_query(query, COLUMN_NAMES, COLUMN_TYPES, **kwargs).filter(ROWS) if len(row) > 1]
+
+class CompileQueryTests(SimpleTestCase):
+    def test_field_terms(self):
+        self.assertEqual(_search("level:error"), ["timeout 150ms at 12:34:56"])
+        self.assertEqual(_search("path:app"), ["timeout 150ms at 12:34:56", "see https://example.com"])
+        self.assertEqual(_search("path=/app"), ["timeout 150ms at 12:34:56"])
+        self.assertEqual(_search("file_line_no:tasks"), ["connection reset"])
+
+    def test_regex_terms(self):
+        self.assertEqual(_search(r"message~/\d+ms/"), ["timeout 150ms at 12:34:56"])
+        self.assertEqual(_search(r"message:/^CONN/i"), ["connection reset"])
+        self.assertEqual(_search(r"/api\.py/"), ["see https://example.com"])
+        self.assertEqual(_search("traceback~Traceback"), ["connection reset"])
+
+    def test_time_terms(self):
+        self.assertEqual(_search("time>2025-08-22T10:30"), ["connection reset"])
+        self.assertEqual(_search("time>=2025-08-22T10:30"), ["timeout 150ms at 12:34:56", "connection reset"])
+        self.assertEqual(_search("time<2025-08-22T10:00 time>2025-08-22T08:00"), ["see https://example.com"])
+
+    def test_terms_are_combined_with_and(self):
+        self.assertEqual(_search("path:app level:info"), ["see https://example.com"])
+        self.assertEqual(_search("path:app level:warning"), [])
+
+    def test_text_terms(self):
+        self.assertEqual(_search("CONNECTION"), ["connection reset"])
+        self.assertEqual(_search('"connection reset"'), ["connection reset"])
+        self.assertEqual(_search("12:34:56"), ["timeout 150ms at 12:34:56"])
+        self.assertEqual(_search("https://example.com"), ["see https://example.com"])
+        self.assertEqual(len(_compile_query('"level:error"', COLUMN_NAMES, COLUMN_TYPES).filter(ROWS)), 1) # Unmatched line
+
+    def test_text_terms_without_columns(self):
+        self.assertEqual(_compile_query("level:error").filter(ROWS), [ROWS[3]])
+
+    def test_invalid_queries(self):
+        for query, message in [
+            ("source:django.request", "Unknown field 'source'. Available fields: file_line_no, level, message, path, time, traceback."),
+            ("message~/(/", "Invalid regex"),
+            ("time>yesterday", "Invalid datetime"),
+            ("path>2025-08-22", "only supported for the TIME column"),
+        ]:
+            with self.subTest(query=query), self.assertRaisesMessage(ValueError, message):
+                _compile_query(query, COLUMN_NAMES, COLUMN_TYPES)
+
+    @override_settings(LOGS_TIMEZONE="Europe/Warsaw")
+    def test_time_offset_is_converted_to_logs_timezone(self):
+        self.assertEqual(_search("time>=2025-08-22T08:30Z"), ["timeout 150ms at 12:34:56", "connection reset"]) # 10:30 in Warsaw
+        self.assertEqual(_search("time>=2025-08-22T12:00+02:00"), ["connection reset"])
+        self.assertEqual(_search("time>2025-08-22T10:00+00:00"), [])
+
+    @override_settings(LOGS_TIMEZONE=None)
+    def test_time_offset_requires_logs_timezone(self):
+        with self.assertRaisesMessage(ValueError, "LOGS_TIMEZONE is not set"):
+            _compile_query("time>2025-08-22T10:00+02:00", COLUMN_NAMES, COLUMN_TYPES)
+        self.assertEqual(_search("time>2025-08-22T10:30"), ["connection reset"])
+
+    def test_form_filters(self):
+        self.assertEqual(_search("", level_filter="error"), ["timeout 150ms at 12:34:56"])
+        self.assertEqual(_search("", time_from="2025-08-22T08:00", time_to="2025-08-22T11:00"), ["timeout 150ms at 12:34:56", "see https://example.com"])
+        self.assertEqual(_search("path:app", time_from="2025-08-22T09:00"), ["timeout 150ms at 12:34:56"])
+        with self.assertRaisesMessage(ValueError, "Invalid datetime"):
+            _compile_query("", COLUMN_NAMES, COLUMN_TYPES, time_from="tomorrow")
+
+    def test_cheap_predicates_first(self):
+        query = _compile_query(r"/timeout/ message:timeout time>2025-08-22T08:00 path=/app level:error", COLUMN_NAMES, COLUMN_TYPES)
+        self.assertEqual([predicate.__qualname__.split(".")[0] for predicate in query._predicates], [
+            "_make_equals_predicate", # level
+            "_make_time_predicate",
+            "_make_column_predicate", # message:timeout (query order kept for the same cost)
+            "_make_equals_predicate", # path=/app
+            "_make_any_predicate",
+        ])
+
+    def test_empty_query_keeps_rows(self):
+        query = _compile_query("", COLUMN_NAMES, COLUMN_TYPES)
+        self.assertFalse(query)
+        self.assertIs(query.filter(ROWS), ROWS)
+
+class HighlightTests(SimpleTestCase):
+    def test_matches_are_marked_and_escaped(self):
+        row = LogRow(["ERROR", "2025-08-22 10:30:00,000", "/app", "views.py:12", "<b>timeout</b> & timeout", ""], start=10, end=20, truncated=True)
+        row.traceback_start = 15
+        highlighted = _compile_query("timeout level:error path=/app", COLUMN_NAMES, COLUMN_TYPES).highlight(row)
+
+        self.assertEqual(highlighted[0], "<mark>ERROR</mark>")
+        self.assertEqual(highlighted[2], "<mark>/app</mark>")
+        self.assertEqual(highlighted[4], "&lt;b&gt;<mark>timeout</mark>&lt;/b&gt; &amp; <mark>timeout</mark>")
+        self.assertEqual(highlighted[3], "views.py:12")
+        self.assertIsInstance(highlighted, LogRow)
+        self.assertEqual((highlighted.start, highlighted.end, highlighted.traceback_start, highlighted.truncated), (10, 20, 15, True))
+        self.assertEqual(row[4], "<b>timeout</b> & timeout") # Original row is not changed
+
+    def test_overlapping_matches_are_merged(self):
+        row = ["INFO", "", "", "", "connection reset", ""]
+        highlighted = _compile_query("connection /tion res/", COLUMN_NAMES, COLUMN_TYPES).highlight(row)
+        self.assertEqual(highlighted[4], "<mark>connection res</mark>et")
@@ -0,0 +1,7 @@
+from django.contrib import admin
+from django.urls import path, include
+
+urlpatterns = [
+    path("admin/logs/", include("django_admin_logs_viewer.urls")),
+    path("admin/", admin.site.urls),
+]